@@ -12,6 +12,8 @@ class Settings(BaseSettings):
     # LLM settings
     gemini_model: str = "gemini-1.5-flash"
     temperature: float = 0.2
+    # Schema-constrained JSON with only the fields we use; False falls back to free-form JSON
+    gemini_structured_output: bool = True
 
     # Maps settings
     maps_radius_meters: int = 8000  # 8km default search radius
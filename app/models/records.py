@@ -0,0 +1,48 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True)
+class HotelRecord:
+    """Internal hotel representation used while fetching, ranking and trimming.
+
+    Kept deliberately unvalidated; it is converted to `models.schemas.Hotel`
+    once, at the tool boundary. Reviews are the plain dicts returned by
+    `services.maps` (author, rating, text, relative_time).
+    """
+
+    name: str
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    rating: Optional[float] = None
+    total_reviews: Optional[int] = None
+    price_per_night: Optional[str] = None
+    amenities: Optional[List[str]] = None
+    room_features: Optional[List[str]] = None
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    distance_km: Optional[float] = None
+    reviews: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def verified(self) -> bool:
+        return self.lat is not None and self.lng is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view matching the `Hotel` schema field names."""
+        return {
+            "name": self.name,
+            "address": self.address,
+            "phone": self.phone,
+            "email": None,
+            "rating": self.rating,
+            "price_per_night": self.price_per_night,
+            "amenities": self.amenities,
+            "room_features": self.room_features,
+            "location": {"lat": self.lat, "lng": self.lng} if self.verified else None,
+            "distance_km": self.distance_km,
+            "verified": self.verified,
+            "reviews": self.reviews,
+            "total_reviews": self.total_reviews,
+        }
@@ -16,23 +16,22 @@ class ReservationRequest(BaseModel):
     room_type: Optional[str] = None
     additional_comments: Optional[str] = None
 
+# Keep in sync with _candidates_schema in services/gemini.py
+class HotelCandidate(BaseModel):
+    """Fields requested from Gemini in structured-output mode; the rest come from Maps."""
+    name: str = ""  # Nameless items are skipped by recommend_hotels rather than failing the batch
+    address: str = ""
+    price_per_night: str = ""
+    amenities: List[str] = Field(default_factory=list)
+    room_features: List[str] = Field(default_factory=list)
+
+class HotelCandidates(BaseModel):
+    hotels: List[HotelCandidate]
+
 class Coordinates(BaseModel):
     lat: float
     lng: float
 
-class Hotel(BaseModel):
-    name: str
-    address: Optional[str] = None
-    phone: Optional[str] = None
-    email: Optional[str] = None
-    rating: Optional[float] = Field(default=None, ge=0, le=5)
-    price_per_night: Optional[str] = None
-    amenities: Optional[List[str]] = None
-    room_features: Optional[List[str]] = None
-    location: Optional[Coordinates] = None
-    distance_km: Optional[float] = None
-    verified: bool = False
-
 class Review(BaseModel):
     author: Optional[str] = None
     rating: Optional[float] = Field(default=None, ge=0, le=5)
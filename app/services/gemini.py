@@ -1,5 +1,7 @@
 import json
-from typing import List, Dict, Any
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from langchain_core.prompts import ChatPromptTemplate
@@ -7,7 +9,7 @@ from langchain_core.output_parsers import StrOutputParser
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from core.config import get_settings
-from models.schemas import ReservationRequest
+from models.schemas import ReservationRequest, HotelCandidates
 
 settings = get_settings()
 
@@ -18,6 +20,12 @@ _system = (
     "If unsure for a field, use null (or an empty list for list fields). Output nothing else besides the JSON."
 )
 
+# Structured mode: the response schema carries the field list and JSON format
+_structured_system = (
+    "You are a helpful travel assistant. Given reservation details, list 20-25 real hotels near the user's provided location.\n"
+    "Leave a field empty if unsure."
+)
+
 _user_tmpl = (
     "Reservation Inputs:\n"
     "- Address: {address}\n"
@@ -35,6 +43,11 @@ prompt = ChatPromptTemplate.from_messages([
     ("user", _user_tmpl),
 ])
 
+structured_prompt = ChatPromptTemplate.from_messages([
+    ("system", _structured_system),
+    ("user", _user_tmpl),
+])
+
 llm = ChatGoogleGenerativeAI(
     model=settings.gemini_model,
     temperature=settings.temperature,
@@ -42,7 +55,53 @@ llm = ChatGoogleGenerativeAI(
     max_retries=1,
 )
 
-chain = prompt | llm | StrOutputParser()
+chain = prompt | llm
+
+_to_text = StrOutputParser()
+
+# Gemini response schema; keep in sync with models.schemas.HotelCandidates. It is passed through
+# generation_config (merged into the GenerationConfig proto), hence the proto-style keys.
+_candidates_schema = {
+    "type_": "OBJECT",
+    "properties": {
+        "hotels": {
+            "type_": "ARRAY",
+            "items": {
+                "type_": "OBJECT",
+                "properties": {
+                    "name": {"type_": "STRING"},
+                    "address": {"type_": "STRING"},
+                    "price_per_night": {"type_": "STRING"},
+                    "amenities": {"type_": "ARRAY", "items": {"type_": "STRING"}},
+                    "room_features": {"type_": "ARRAY", "items": {"type_": "STRING"}},
+                },
+                "required": ["name"],
+            },
+        },
+    },
+    "required": ["hotels"],
+}
+
+
+@lru_cache(maxsize=1)
+def _structured_chain():
+    # Built on first use so the free-form mode never depends on structured-output support
+    return structured_prompt | llm.bind(generation_config={
+        "response_mime_type": "application/json",
+        "response_schema": _candidates_schema,
+    })
+
+
+def _print_stats(mode: str, message: Any, started: float, error: Optional[Exception]) -> None:
+    usage = getattr(message, "usage_metadata", None) or {}
+    latency_ms = round((time.perf_counter() - started) * 1000, 1)
+    line = (
+        f"gemini generation: mode={mode} prompt_tokens={usage.get('input_tokens')} "
+        f"completion_tokens={usage.get('output_tokens')} latency_ms={latency_ms}"
+    )
+    if error is not None:
+        line += f" error={type(error).__name__}"
+    print(line)
 
 
 def _strip_markdown_fence(text: str) -> str:
@@ -59,27 +118,71 @@ def _strip_markdown_fence(text: str) -> str:
     return t.strip()
 
 
-@retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4))
-def generate_hotel_candidates(reservation: ReservationRequest) -> List[Dict[str, Any]]:
-    payload = reservation.model_dump()
+def _is_quota_error(e: Exception) -> bool:
+    msg = str(e)
+    return "ResourceExhausted" in msg or "429" in msg or "rate" in msg.lower()
+
+
+def _invoke(mode: str, runnable: Any, payload: Dict[str, Any]) -> Optional[Any]:
+    """Invoke the model and print one stats line; returns None on quota/rate limit errors."""
+    started = time.perf_counter()
     try:
-        raw = chain.invoke(payload)
-    except Exception as e:  # Short-circuit on quota/rate limit to trigger maps fallback
-        msg = str(e)
-        if "ResourceExhausted" in msg or "429" in msg or "rate" in msg.lower():
-            return []
+        message = runnable.invoke(payload)
+    except Exception as e:
+        _print_stats(mode, None, started, e)
+        if _is_quota_error(e):  # Short-circuit on quota/rate limit to trigger maps fallback
+            return None
+        raise
+    _print_stats(mode, message, started, None)
+    return message
+
+
+def _generate_structured(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    message = _invoke("structured", _structured_chain(), payload)
+    if message is None:
+        return []
+    try:
+        parsed = HotelCandidates.model_validate_json(_strip_markdown_fence(_to_text.invoke(message)))
+    except ValueError as e:  # Re-raise so that the @retry on generate_hotel_candidates applies
+        print(f"gemini parse error: mode=structured error={type(e).__name__}")
         raise
-    text = _strip_markdown_fence(raw)
+    return [
+        {
+            "name": h.name,
+            "address": h.address or None,
+            "price_per_night": h.price_per_night or None,
+            "amenities": h.amenities,
+            "room_features": h.room_features,
+        }
+        for h in parsed.hotels
+    ]
+
+
+def _generate_freeform(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    message = _invoke("freeform", chain, payload)
+    if message is None:
+        return []
+    text = _strip_markdown_fence(_to_text.invoke(message))
     try:
         data = json.loads(text)
     except json.JSONDecodeError:
         start = text.find("{")
         end = text.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            data = json.loads(text[start:end+1])
-        else:
+        if start == -1 or end == -1 or end <= start:
             return []
+        try:
+            data = json.loads(text[start:end+1])
+        except json.JSONDecodeError as e:  # Re-raise so that the @retry on generate_hotel_candidates applies
+            print(f"gemini parse error: mode=freeform error={type(e).__name__}")
+            raise
     hotels = data.get("hotels", []) if isinstance(data, dict) else []
     if not isinstance(hotels, list):
         return []
-    return hotels[: settings.max_candidates]
+    return hotels
+
+
+@retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4))
+def generate_hotel_candidates(reservation: ReservationRequest) -> List[Dict[str, Any]]:
+    payload = reservation.model_dump()
+    generate = _generate_structured if settings.gemini_structured_output else _generate_freeform
+    return generate(payload)[: settings.max_candidates]
@@ -2,7 +2,8 @@ from __future__ import annotations
 from typing import List, Dict, Any
 
 from core.config import get_settings
-from models.schemas import ReservationRequest, Hotel, Coordinates, Review
+from models.records import HotelRecord
+from models.schemas import ReservationRequest
 from services.gemini import generate_hotel_candidates
 from services.maps import geocode, find_hotel_by_name_near, distance_km_between, find_hotels_text_search, find_hotel_by_name_and_address_near
 
@@ -31,40 +32,29 @@ def _normalize_price_per_night(value: Any) -> str | None:
     return str(value)
 
 
-def _to_hotel_from_maps(d: Dict[str, Any], ref_lat: float, ref_lng: float) -> Hotel:
+def _to_hotel_from_maps(d: Dict[str, Any], ref_lat: float, ref_lng: float) -> HotelRecord:
     hotel_lat = d.get("lat")
     hotel_lng = d.get("lng")
     dist = None
-    coords = None
+    lat = lng = None
     if isinstance(hotel_lat, (float, int)) and isinstance(hotel_lng, (float, int)):
-        dist = distance_km_between(ref_lat, ref_lng, float(hotel_lat), float(hotel_lng))
-        coords = Coordinates(lat=float(hotel_lat), lng=float(hotel_lng))
-    reviews = []
-    for rv in (d.get("reviews") or [])[:5]:
-        reviews.append(Review(
-            author=rv.get("author"),
-            rating=rv.get("rating"),
-            text=rv.get("text"),
-            relative_time=rv.get("relative_time"),
-        ))
-    return Hotel(
+        lat, lng = float(hotel_lat), float(hotel_lng)
+        dist = distance_km_between(ref_lat, ref_lng, lat, lng)
+    return HotelRecord(
         name=d.get("name", "Unknown"),
         address=d.get("address"),
         phone=d.get("phone"),
-        email=None,
         rating=d.get("rating"),
         total_reviews=d.get("total_reviews"),
         price_per_night=_format_price_level(d.get("price_level")),
-        amenities=None,
-        room_features=None,
-        location=coords,
+        lat=lat,
+        lng=lng,
         distance_km=round(dist, 2) if isinstance(dist, float) else None,
-        verified=coords is not None,
-        reviews=reviews or None,
+        reviews=(d.get("reviews") or [])[:5] or None,
     )
 
 
-def recommend_hotels(reservation: ReservationRequest) -> List[Hotel]:
+def recommend_hotels(reservation: ReservationRequest) -> List[HotelRecord]:
     ref_text = _coalesce_location_text(reservation)
     ref_coords = geocode(ref_text) if ref_text else None
 
@@ -76,7 +66,7 @@ def recommend_hotels(reservation: ReservationRequest) -> List[Hotel]:
     print(gemini_hotels)
 
 
-    verified: List[Hotel] = []
+    verified: List[HotelRecord] = []
 
     if not gemini_hotels and ref_coords:
         ref_lat, ref_lng = ref_coords
@@ -94,14 +84,15 @@ def recommend_hotels(reservation: ReservationRequest) -> List[Hotel]:
         address = item.get("address")
         # Ignore Gemini values for phone, email, rating; will fetch from Maps for accuracy
         phone = None
-        email = None
         rating = None
         price_per_night = item.get("price_per_night")
         amenities = item.get("amenities")
         room_features = item.get("room_features")
 
         distance_km: float | None = None
-        lat_lng = None
+        hotel_lat: float | None = None
+        hotel_lng: float | None = None
+        details: Dict[str, Any] | None = None
 
         if ref_coords:
             ref_lat, ref_lng = ref_coords
@@ -110,7 +101,6 @@ def recommend_hotels(reservation: ReservationRequest) -> List[Hotel]:
             if details and details.get("lat") is not None and details.get("lng") is not None:
                 hotel_lat = float(details["lat"])  # type: ignore[index]
                 hotel_lng = float(details["lng"])  # type: ignore[index]
-                lat_lng = Coordinates(lat=hotel_lat, lng=hotel_lng)
                 distance_km = distance_km_between(ref_lat, ref_lng, hotel_lat, hotel_lng)
                 address = details.get("address") or address
                 phone = details.get("phone")
@@ -118,33 +108,23 @@ def recommend_hotels(reservation: ReservationRequest) -> List[Hotel]:
                 if price_per_night is None:
                     price_per_night = _format_price_level(details.get("price_level"))
 
-        reviews = []
-        if details and details.get("reviews"):
-            for rv in details.get("reviews", [])[:5]:
-                reviews.append(Review(
-                    author=rv.get("author"),
-                    rating=rv.get("rating"),
-                    text=rv.get("text"),
-                    relative_time=rv.get("relative_time"),
-                ))
-        hotel = Hotel(
+        hotel = HotelRecord(
             name=name,
             address=address,
             phone=phone,
-            email=email,
             rating=rating,
-            total_reviews=(details or {}).get("total_reviews") if 'details' in locals() else None,
+            total_reviews=(details or {}).get("total_reviews"),
             price_per_night=_normalize_price_per_night(price_per_night),
             amenities=amenities,
             room_features=room_features,
-            location=lat_lng,
+            lat=hotel_lat,
+            lng=hotel_lng,
             distance_km=round(distance_km, 2) if isinstance(distance_km, float) else None,
-            verified=lat_lng is not None,
-            reviews=reviews or None,
+            reviews=((details or {}).get("reviews") or [])[:5] or None,
         )
         verified.append(hotel)
 
-    def sort_key(h: Hotel):
+    def sort_key(h: HotelRecord):
         return (
             0 if h.verified else 1,
             h.distance_km if h.distance_km is not None else 1e9,
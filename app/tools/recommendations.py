@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+from typing import List
+
 from agency_swarm.tools import BaseTool
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 from dotenv import load_dotenv
 
-from models.schemas import ReservationRequest
+from models.schemas import ReservationRequest, Hotel
 from services.recommender import recommend_hotels
 
 load_dotenv()
 
+# Validation and serialization of results happen once, here at the tool boundary
+_hotels_adapter = TypeAdapter(List[Hotel])
+
 
 class GetHotelRecommendationsTool(BaseTool):
     """
@@ -54,10 +59,10 @@ class GetHotelRecommendationsTool(BaseTool):
                 additional_comments=self.additional_comments,
             )
 
-            hotels = recommend_hotels(reservation)
-            # Return the raw hotel data as a string (e.g., JSON string)
-            import json
-            return json.dumps([h.model_dump() if hasattr(h, "model_dump") else h.dict() for h in hotels], default=str, ensure_ascii=False, indent=2)
+            records = recommend_hotels(reservation)
+            # Return the hotel data as a JSON string
+            hotels = _hotels_adapter.validate_python([r.to_dict() for r in records])
+            return _hotels_adapter.dump_json(hotels, indent=2).decode("utf-8")
         
         except Exception as e:
             print(e)
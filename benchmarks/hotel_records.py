@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-request cost of building hotel results.
+
+Compares the previous pipeline (a pydantic `Hotel` with nested `Review`/`Coordinates`
+per candidate, then `model_dump()` + `json.dumps`) against the current one
+(`HotelRecord` through fetch/rank/trim, one `TypeAdapter` validate + `dump_json`
+at the tool boundary). Only the kept results are validated in the new path.
+
+Usage: python benchmarks/hotel_records.py [--candidates 25] [--results 10] [--rounds 2000]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from models.records import HotelRecord  # noqa: E402
+from models.schemas import Coordinates, Hotel, Review  # noqa: E402
+
+_hotels_adapter = TypeAdapter(List[Hotel])
+
+
+def _maps_details(i: int) -> Dict[str, Any]:
+    return {
+        "name": f"Hotel {i}",
+        "address": f"{i} Market St, San Francisco, CA",
+        "phone": "+1 415-555-0100",
+        "rating": 4.2,
+        "total_reviews": 1200 + i,
+        "lat": 37.79 + i * 0.001,
+        "lng": -122.39 - i * 0.001,
+        "price_level": 3,
+        "reviews": [
+            {"author": f"Guest {j}", "rating": 4, "text": "Great stay, friendly staff. " * 4, "relative_time": "a month ago"}
+            for j in range(5)
+        ],
+    }
+
+
+def _distance(d: Dict[str, Any]) -> float:
+    return abs(d["lat"] - 37.79) * 111.0
+
+
+def _rank(items, key, limit):
+    items.sort(key=key)
+    return items[:limit]
+
+
+def legacy(candidates: List[Dict[str, Any]], max_results: int) -> str:
+    hotels = []
+    for d in candidates:
+        reviews = [Review(**rv) for rv in d["reviews"][:5]]
+        hotels.append(Hotel(
+            name=d["name"],
+            address=d["address"],
+            phone=d["phone"],
+            email=None,
+            rating=d["rating"],
+            total_reviews=d["total_reviews"],
+            price_per_night="$$$",
+            location=Coordinates(lat=d["lat"], lng=d["lng"]),
+            distance_km=round(_distance(d), 2),
+            verified=True,
+            reviews=reviews or None,
+        ))
+    hotels = _rank(hotels, lambda h: (0 if h.verified else 1, h.distance_km, -(h.rating or 0)), max_results)
+    return json.dumps([h.model_dump() for h in hotels], default=str, ensure_ascii=False, indent=2)
+
+
+def current(candidates: List[Dict[str, Any]], max_results: int) -> str:
+    records = []
+    for d in candidates:
+        records.append(HotelRecord(
+            name=d["name"],
+            address=d["address"],
+            phone=d["phone"],
+            rating=d["rating"],
+            total_reviews=d["total_reviews"],
+            price_per_night="$$$",
+            lat=d["lat"],
+            lng=d["lng"],
+            distance_km=round(_distance(d), 2),
+            reviews=d["reviews"][:5] or None,
+        ))
+    records = _rank(records, lambda h: (0 if h.verified else 1, h.distance_km, -(h.rating or 0)), max_results)
+    hotels = _hotels_adapter.validate_python([r.to_dict() for r in records])
+    return _hotels_adapter.dump_json(hotels, indent=2).decode("utf-8")
+
+
+def _measure(fn, candidates, max_results, rounds):
+    fn(candidates, max_results)  # warm up
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    for _ in range(rounds):
+        fn(candidates, max_results)
+    cpu_us = (time.process_time() - cpu_start) / rounds * 1e6
+    wall_us = (time.perf_counter() - wall_start) / rounds * 1e6
+
+    tracemalloc.start()
+    fn(candidates, max_results)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu_us, wall_us, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=25)
+    parser.add_argument("--results", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    candidates = [_maps_details(i) for i in range(args.candidates)]
+    assert json.loads(legacy(candidates, args.results)) == json.loads(current(candidates, args.results))
+
+    print(f"candidates={args.candidates} results={args.results} rounds={args.rounds}")
+    rows = [(name, *_measure(fn, candidates, args.results, args.rounds)) for name, fn in (("legacy", legacy), ("current", current))]
+    for name, cpu_us, wall_us, peak in rows:
+        print(f"{name:>8}: {cpu_us:9.1f} us CPU/request  {wall_us:9.1f} us wall/request  peak alloc {peak / 1024:8.1f} KiB")
+    (_, old_cpu, _, old_peak), (_, new_cpu, _, new_peak) = rows
+    print(f" CPU speedup: {old_cpu / new_cpu:.2f}x  alloc: {new_peak / old_peak:.0%} of legacy")
+
+
+if __name__ == "__main__":
+    main()